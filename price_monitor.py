@@ -4,33 +4,207 @@ Product Price Monitoring Tool
 Scrapes product information from fitness equipment websites
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
+import asyncio
+import hishel
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
+import orjson
 import re
-from typing import List, Dict, Optional
-from urllib.parse import urljoin
+from typing import Callable, List, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 import sys
 import time
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+
+
+# Patterns used on every scraped product, compiled once
+_PRODUCT_CLASS_RE = re.compile(r'product|item|card', re.I)
+
+
+def _make_price_parser(currency: str = '$') -> Callable[[str], Optional[float]]:
+    """Build a price parser specialized for one currency symbol"""
+    # A grouped ("1,299") or plain ("1299") amount with optional cents
+    price_re = re.compile(f'(?:{re.escape(currency)})?' + r'\s*((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d{2})?)')
+
+    def parse_price(price_text: str, _search=price_re.search) -> Optional[float]:
+        if not price_text:
+            return None
+
+        # Extract the first amount, keeping thousands separators
+        price_match = _search(price_text)
+        if price_match:
+            return float(price_match.group(1).replace(',', ''))
+        return None
+
+    return parse_price
+
+
+_parse_usd = _make_price_parser('$')
+
+
+def _class_xpath(tags: List[str], pattern: str) -> etree.XPath:
+    """Compile an XPath for descendant tags whose class matches pattern, ignoring case"""
+    tag_test = ' or '.join(f'self::{tag}' for tag in tags)
+    return etree.XPath(f".//*[{tag_test}][re:test(@class, '{pattern}', 'i')]",
+                       namespaces={'re': 'http://exslt.org/regular-expressions'})
+
+
+_TITLE_XPATH = _class_xpath(['h2', 'h3', 'h4', 'a'], 'title|name|product')
+_PRICE_XPATH = _class_xpath(['span', 'div', 'p'], 'price')
+
+
+def _card_record(card: lxml_html.HtmlElement) -> Optional[Tuple[str, List[str]]]:
+    """Return the product name and candidate price texts of a product card"""
+    name_elems = _TITLE_XPATH(card)
+    name_elem = name_elems[0] if name_elems else None
+    if name_elem is None:
+        name_elem = next(card.iterdescendants('a'), None)
+
+    if name_elem is None:
+        return None
+
+    price_texts = [elem.text_content().strip() for elem in _PRICE_XPATH(card)]
+    return ' '.join(name_elem.text_content().split()), price_texts
+
+
+class Product(NamedTuple):
+    """A scraped product listing"""
+    name: str
+    brand: str
+    category: str
+    msrp: float
+    sale_price: Optional[float]
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Product':
+        """Build a product from its JSON representation"""
+        return cls(data['Product'], data['Brand'], data['Category'], data['MSRP'], data['Sale Price'])
+
+    def to_dict(self) -> Dict:
+        """Return the JSON representation of the product"""
+        return {
+            'Product': self.name,
+            'Brand': self.brand,
+            'Category': self.category,
+            'MSRP': self.msrp,
+            'Sale Price': self.sale_price,
+        }
+
+
+class ProductParser:
+    """Incremental HTML parser collecting the first product cards of a page
+
+    Product containers are recognised from their start tags and turned into
+    (name, price texts) records as soon as they close, so parsing can stop
+    once the first ``limit`` cards are complete instead of building the
+    whole page tree.
+    """
+
+    def __init__(self, limit: int = 10, encoding: Optional[str] = None):
+        self.limit = limit
+        self.records: List[Optional[Tuple[str, List[str]]]] = []
+        self._open: List[Tuple[lxml_html.HtmlElement, int]] = []
+        self._parser = etree.HTMLPullParser(events=('start', 'end'), tag=('div', 'article'), encoding=encoding)
+        self._parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+
+    @property
+    def done(self) -> bool:
+        """Whether the first limit product cards have been parsed"""
+        return len(self.records) >= self.limit and not self._open
+
+    def feed(self, data: bytes):
+        """Parse the next chunk of the page"""
+        self._parser.feed(data)
+        self._read_events()
+
+    def close(self) -> List[Tuple[str, List[str]]]:
+        """Finish parsing and return the records of named product cards"""
+        if not self.done:
+            self._parser.close()
+            self._read_events()
+        return [record for record in self.records if record is not None]
+
+    def _read_events(self):
+        for event, elem in self._parser.read_events():
+            if event == 'start':
+                if len(self.records) < self.limit and _PRODUCT_CLASS_RE.search(elem.get('class', '')):
+                    # Keep the record slot so cards stay in document order
+                    self._open.append((elem, len(self.records)))
+                    self.records.append(None)
+            elif self._open and elem is self._open[-1][0]:
+                _, index = self._open.pop()
+                self.records[index] = _card_record(elem)
+                if not self._open:
+                    # No enclosing card still needs this subtree
+                    elem.clear(keep_tail=True)
+
+
+class TokenBucket:
+    """Rate limiter allowing short bursts of requests to a single host"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        """Reserve the next token and wait until it becomes available"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        # A negative balance is the queue of requests already scheduled for this host
+        self.tokens -= 1
+        if self.tokens < 0:
+            await asyncio.sleep(-self.tokens / self.rate)
 
 
 class PriceMonitor:
     """Main class for monitoring product prices across multiple websites"""
 
-    def __init__(self):
-        self.session = requests.Session()
-
+    # (brand, base URL, {category: path}, price parser) for every monitored website
+    SITES = [
+        ('Bowflex', 'https://www.bowflex.com', {
+            'Treadmills': '/treadmills/',
+            'Indoor Cycling Bikes': '/bikes/',
+            'Home Gyms': '/strength/',
+            'Adjustable Dumbbells': '/selecttech/',
+            'Ellipticals and Max Trainer': '/max-trainer/',
+        }, _parse_usd),
+        ('Horizon Fitness', 'https://www.horizonfitness.com', {
+            'Treadmills': '/treadmills',
+            'Indoor Cycling Bikes': '/bikes',
+            'Ellipticals and Max Trainer': '/ellipticals',
+        }, _parse_usd),
+        ('Schwinn', 'https://www.schwinnfitness.com', {
+            'Treadmills': '/treadmills',
+            'Indoor Cycling Bikes': '/bikes',
+            'Ellipticals and Max Trainer': '/ellipticals',
+        }, _parse_usd),
+    ]
+
+    def __init__(self, use_cache: bool = False):
         # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.max_retries = 3
+        self.backoff_factor = 0.3
+        self.retry_statuses = {429, 500, 502, 503, 504}
+
+        # Product grids sit near the top of a page; skip the rest of huge pages
+        self.max_page_bytes = 512 * 1024
+
+        # Seconds a cached page stays valid when caching is enabled
+        self.cache_ttl = 3600
+
+        # Limit concurrent requests and request rate per host to stay polite
+        self.per_host_limit = 8
+        self.per_host_burst = 3
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_buckets: Dict[str, TokenBucket] = {}
+
+        # robots.txt rules are fetched once per host and shared by its requests
+        self._host_robots: Dict[str, asyncio.Task] = {}
 
         # More realistic headers
         self.headers = {
@@ -39,7 +213,6 @@ class PriceMonitor:
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate, br',
             'DNT': '1',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
             'Sec-Fetch-Mode': 'navigate',
@@ -47,6 +220,28 @@ class PriceMonitor:
             'Cache-Control': 'max-age=0',
         }
 
+        # HTTP/2 multiplexes all requests to a host over one connection
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=self.max_retries,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=4, keepalive_expiry=60),
+        )
+
+        # Optionally keep fetched pages on disk so re-runs skip the network
+        if use_cache:
+            transport = hishel.AsyncCacheTransport(
+                transport=transport,
+                storage=hishel.AsyncFileStorage(ttl=self.cache_ttl),
+                controller=hishel.Controller(force_cache=True, cacheable_status_codes=[200]),
+            )
+
+        self.client = httpx.AsyncClient(
+            transport=transport,
+            headers=self.headers,
+            timeout=30,
+            follow_redirects=True,
+        )
+
         self.categories = [
             'Treadmills',
             'Indoor Cycling Bikes',
@@ -54,21 +249,96 @@ class PriceMonitor:
             'Ellipticals and Max Trainer',
             'Adjustable Dumbbells'
         ]
-        self.products = []
-
-    def fetch_page(self, url: str, delay: float = 2.0) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page with retry logic"""
+        self.products: List[Product] = []
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent requests to url's host"""
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    def _host_bucket(self, url: str, delay: float) -> TokenBucket:
+        """Return the token bucket rate limiting requests to url's host"""
+        host = urlparse(url).netloc
+        if host not in self._host_buckets:
+            self._host_buckets[host] = TokenBucket(1 / delay, self.per_host_burst)
+        return self._host_buckets[host]
+
+    async def _fetch_robots(self, robots_url: str, delay: float = 2.0) -> RobotFileParser:
+        """Fetch and parse a robots.txt file, following RFC 9309 for errors"""
+        rules = RobotFileParser(robots_url)
+        try:
+            # Counts against the host's concurrency and rate limits like any page
+            async with self._host_semaphore(robots_url):
+                await self._host_bucket(robots_url, delay).acquire()
+                response = await self.client.get(robots_url)
+        except httpx.HTTPError:
+            # An unreachable robots.txt means the whole host is off limits
+            rules.disallow_all = True
+            return rules
+
+        if response.status_code in (401, 403) or response.status_code >= 500:
+            rules.disallow_all = True
+        elif response.status_code >= 400:
+            rules.allow_all = True
+        else:
+            rules.parse(response.text.splitlines())
+        return rules
+
+    async def _robots_rules(self, url: str, delay: float = 2.0) -> RobotFileParser:
+        """Return the robots.txt rules of url's host"""
+        parts = urlparse(url)
+        if parts.netloc not in self._host_robots:
+            robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+            self._host_robots[parts.netloc] = asyncio.ensure_future(self._fetch_robots(robots_url, delay))
+        return await self._host_robots[parts.netloc]
+
+    async def _read_products(self, response: httpx.Response) -> List[Tuple[str, List[str]]]:
+        """Stream a response body into a ProductParser until enough is parsed"""
+        # A charset from the headers spares lxml sniffing the bytes for <meta charset>
+        try:
+            parser = ProductParser(encoding=response.charset_encoding)
+        except LookupError:
+            # libxml2 doesn't know the declared charset; let it sniff instead
+            parser = ProductParser()
+        size = 0
+        async for chunk in response.aiter_bytes(64 * 1024):
+            parser.feed(chunk)
+            size += len(chunk)
+            if parser.done or size > self.max_page_bytes:
+                break
+        return parser.close()
+
+    async def fetch_page(self, url: str, delay: float = 2.0) -> Optional[List[Tuple[str, List[str]]]]:
+        """Fetch a web page with retry logic and parse its product cards"""
         try:
             if not url.startswith('http'):
                 url = 'https://' + url
 
-            # Add delay to avoid rate limiting
-            time.sleep(delay)
-
-            response = self.session.get(url, headers=self.headers, timeout=30, allow_redirects=True)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'lxml')
-        except requests.exceptions.HTTPError as e:
+            # Skip pages the site asks bots not to fetch without a round trip
+            rules = await self._robots_rules(url, delay)
+            if not rules.can_fetch(self.headers['User-Agent'], url):
+                print(f"Disallowed by robots.txt: {url}", file=sys.stderr)
+                return None
+
+            bucket = self._host_bucket(url, delay)
+            async with self._host_semaphore(url):
+                for attempt in range(self.max_retries + 1):
+                    # Average one request per delay seconds to avoid rate limiting
+                    await bucket.acquire()
+                    async with self.client.stream('GET', url) as response:
+                        if response.status_code not in self.retry_statuses or attempt == self.max_retries:
+                            response.raise_for_status()
+                            return await self._read_products(response)
+                        retry_after = response.headers.get('Retry-After', '')
+
+                    # Honor the server's Retry-After, else back off exponentially
+                    if retry_after.isdigit():
+                        await asyncio.sleep(int(retry_after))
+                    else:
+                        await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+        except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
                 print(f"Access denied (403) for {url}. Website may have bot protection.", file=sys.stderr)
             else:
@@ -80,198 +350,95 @@ class PriceMonitor:
 
     def extract_price(self, price_text: str) -> Optional[float]:
         """Extract numeric price from text"""
-        if not price_text:
-            return None
-
-        # Remove currency symbols and extract numbers
-        price_match = re.search(r'[\$]?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', price_text.replace(',', ''))
-        if price_match:
-            return float(price_match.group(1).replace(',', ''))
-        return None
-
-    def scrape_bowflex(self):
-        """Scrape product information from Bowflex website"""
-        print("Scraping Bowflex.com...")
-        base_url = "https://www.bowflex.com"
-
-        # Try to find category pages
-        category_urls = {
-            'Treadmills': f"{base_url}/treadmills/",
-            'Indoor Cycling Bikes': f"{base_url}/bikes/",
-            'Home Gyms': f"{base_url}/strength/",
-            'Adjustable Dumbbells': f"{base_url}/selecttech/",
-            'Ellipticals and Max Trainer': f"{base_url}/max-trainer/"
-        }
-
-        for category, url in category_urls.items():
-            soup = self.fetch_page(url)
-            if not soup:
-                continue
-
-            # Look for product listings - common patterns
-            products = soup.find_all(['div', 'article'], class_=re.compile(r'product|item|card', re.I))
-
-            for product in products[:10]:  # Limit to first 10 products per category
-                try:
-                    # Extract product name
-                    name_elem = product.find(['h2', 'h3', 'h4', 'a'], class_=re.compile(r'title|name|product', re.I))
-                    if not name_elem:
-                        name_elem = product.find('a')
-
-                    if not name_elem:
-                        continue
-
-                    product_name = name_elem.get_text(strip=True)
-
-                    # Extract prices
-                    price_elems = product.find_all(['span', 'div', 'p'], class_=re.compile(r'price', re.I))
-                    prices = []
-
-                    for price_elem in price_elems:
-                        price_text = price_elem.get_text(strip=True)
-                        price = self.extract_price(price_text)
-                        if price:
-                            prices.append(price)
-
-                    if prices:
-                        msrp = max(prices)
-                        sale_price = min(prices)
-
-                        self.products.append({
-                            'Product': product_name,
-                            'Brand': 'Bowflex',
-                            'Category': category,
-                            'MSRP': msrp if len(prices) > 1 else msrp,
-                            'Sale Price': sale_price if len(prices) > 1 else None
-                        })
-                except Exception as e:
-                    continue
-
-    def scrape_horizon(self):
-        """Scrape product information from Horizon Fitness website"""
-        print("Scraping HorizonFitness.com...")
-        base_url = "https://www.horizonfitness.com"
-
-        category_urls = {
-            'Treadmills': f"{base_url}/treadmills",
-            'Indoor Cycling Bikes': f"{base_url}/bikes",
-            'Ellipticals and Max Trainer': f"{base_url}/ellipticals"
-        }
-
-        for category, url in category_urls.items():
-            soup = self.fetch_page(url)
-            if not soup:
+        return _parse_usd(price_text)
+
+    def _extract_products(self, records: List[Tuple[str, List[str]]], brand: str, category: str,
+                          parse_price: Callable[[str], Optional[float]]) -> List[Product]:
+        """Build product entries from the parsed product cards of a category page"""
+        results = []
+
+        for product_name, price_texts in records:
+            try:
+                # Track the highest and lowest price in a single pass
+                msrp = sale_price = None
+                count = 0
+
+                for price_text in price_texts:
+                    price = parse_price(price_text)
+                    if price:
+                        if msrp is None or price > msrp:
+                            msrp = price
+                        if sale_price is None or price < sale_price:
+                            sale_price = price
+                        count += 1
+
+                if count:
+                    results.append(Product(product_name, brand, category, msrp,
+                                           sale_price if count > 1 else None))
+            except Exception as e:
                 continue
 
-            products = soup.find_all(['div', 'article'], class_=re.compile(r'product|item|card', re.I))
-
-            for product in products[:10]:
-                try:
-                    name_elem = product.find(['h2', 'h3', 'h4', 'a'], class_=re.compile(r'title|name|product', re.I))
-                    if not name_elem:
-                        name_elem = product.find('a')
-
-                    if not name_elem:
-                        continue
-
-                    product_name = name_elem.get_text(strip=True)
-
-                    price_elems = product.find_all(['span', 'div', 'p'], class_=re.compile(r'price', re.I))
-                    prices = []
-
-                    for price_elem in price_elems:
-                        price_text = price_elem.get_text(strip=True)
-                        price = self.extract_price(price_text)
-                        if price:
-                            prices.append(price)
-
-                    if prices:
-                        msrp = max(prices)
-                        sale_price = min(prices)
-
-                        self.products.append({
-                            'Product': product_name,
-                            'Brand': 'Horizon Fitness',
-                            'Category': category,
-                            'MSRP': msrp if len(prices) > 1 else msrp,
-                            'Sale Price': sale_price if len(prices) > 1 else None
-                        })
-                except Exception as e:
-                    continue
-
-    def scrape_schwinn(self):
-        """Scrape product information from Schwinn Fitness website"""
-        print("Scraping SchwinnFitness.com...")
-        base_url = "https://www.schwinnfitness.com"
-
-        category_urls = {
-            'Treadmills': f"{base_url}/treadmills",
-            'Indoor Cycling Bikes': f"{base_url}/bikes",
-            'Ellipticals and Max Trainer': f"{base_url}/ellipticals"
-        }
-
-        for category, url in category_urls.items():
-            soup = self.fetch_page(url)
-            if not soup:
-                continue
-
-            products = soup.find_all(['div', 'article'], class_=re.compile(r'product|item|card', re.I))
-
-            for product in products[:10]:
-                try:
-                    name_elem = product.find(['h2', 'h3', 'h4', 'a'], class_=re.compile(r'title|name|product', re.I))
-                    if not name_elem:
-                        name_elem = product.find('a')
-
-                    if not name_elem:
-                        continue
-
-                    product_name = name_elem.get_text(strip=True)
+        return results
 
-                    price_elems = product.find_all(['span', 'div', 'p'], class_=re.compile(r'price', re.I))
-                    prices = []
+    async def _scrape_one(self, brand: str, category: str, url: str,
+                          parse_price: Callable[[str], Optional[float]]) -> List[Product]:
+        """Scrape the product listings from a single category page"""
+        records = await self.fetch_page(url)
+        if records is None:
+            return []
 
-                    for price_elem in price_elems:
-                        price_text = price_elem.get_text(strip=True)
-                        price = self.extract_price(price_text)
-                        if price:
-                            prices.append(price)
+        return self._extract_products(records, brand, category, parse_price)
 
-                    if prices:
-                        msrp = max(prices)
-                        sale_price = min(prices)
-
-                        self.products.append({
-                            'Product': product_name,
-                            'Brand': 'Schwinn',
-                            'Category': category,
-                            'MSRP': msrp if len(prices) > 1 else msrp,
-                            'Sale Price': sale_price if len(prices) > 1 else None
-                        })
-                except Exception as e:
-                    continue
+    async def _scrape_site(self, brand: str, base: str, paths: Dict[str, str],
+                           parse_price: Callable[[str], Optional[float]]) -> List[Product]:
+        """Scrape all category pages of a website concurrently"""
+        print(f"Scraping {urlparse(base).netloc}...")
+        results = await asyncio.gather(*[self._scrape_one(brand, category, urljoin(base, path), parse_price)
+                                         for category, path in paths.items()])
+        return [product for products in results for product in products]
 
     def load_from_file(self, filename: str = "sample_products.json"):
         """Load products from a JSON file"""
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-                self.products.extend(data)
+            with open(filename, 'rb') as f:
+                data = orjson.loads(f.read())
+
+                # Brands and categories repeat on every row; keep one copy of each
+                for product in data:
+                    product['Brand'] = sys.intern(product['Brand'])
+                    product['Category'] = sys.intern(product['Category'])
+
+                self.products.extend(Product.from_dict(product) for product in data)
                 print(f"Loaded {len(data)} products from {filename}")
         except FileNotFoundError:
             print(f"File {filename} not found")
         except Exception as e:
             print(f"Error loading from {filename}: {e}")
 
+    async def _warm_dns(self):
+        """Resolve all monitored hosts up front to warm the resolver cache"""
+        loop = asyncio.get_running_loop()
+        hosts = {urlparse(base).hostname for _, base, _, _ in self.SITES}
+        await asyncio.gather(*[loop.getaddrinfo(host, 443) for host in hosts], return_exceptions=True)
+
+    async def _run_async(self):
+        """Scrape all websites concurrently"""
+        try:
+            await self._warm_dns()
+            results = await asyncio.gather(*[self._scrape_site(brand, base, paths, parse_price)
+                                             for brand, base, paths, parse_price in self.SITES])
+            for products in results:
+                self.products.extend(products)
+        finally:
+            await self.client.aclose()
+
     def run(self, use_sample_data: bool = False):
         """Run the price monitor for all websites"""
         if use_sample_data:
             print("Loading sample data instead of scraping...")
             self.load_from_file("sample_products.json")
         else:
-            self.scrape_bowflex()
-            self.scrape_horizon()
-            self.scrape_schwinn()
+            asyncio.run(self._run_async())
 
             # If no products found due to bot protection, suggest using sample data
             if not self.products:
@@ -293,28 +460,33 @@ class PriceMonitor:
             print("\nNo products found.")
             return
 
-        # Print table header
-        print("\n" + "="*100)
-        print(f"{'Product':<40} {'Brand':<20} {'Category':<25} {'MSRP':<12} {'Sale Price':<12}")
-        print("="*100)
+        # Table header
+        rows = [
+            "\n" + "="*100,
+            f"{'Product':<40} {'Brand':<20} {'Category':<25} {'MSRP':<12} {'Sale Price':<12}",
+            "="*100,
+        ]
 
-        # Print each product
+        # One row per product
         for product in self.products:
-            product_name = product['Product'][:38] + '..' if len(product['Product']) > 40 else product['Product']
-            brand = product['Brand']
-            category = product['Category'][:23] + '..' if len(product['Category']) > 25 else product['Category']
-            msrp = self.format_price(product['MSRP'])
-            sale_price = self.format_price(product['Sale Price'])
+            product_name = product.name[:38] + '..' if len(product.name) > 40 else product.name
+            brand = product.brand
+            category = product.category[:23] + '..' if len(product.category) > 25 else product.category
+            msrp = self.format_price(product.msrp)
+            sale_price = self.format_price(product.sale_price)
+
+            rows.append(f"{product_name:<40} {brand:<20} {category:<25} {msrp:<12} {sale_price:<12}")
 
-            print(f"{product_name:<40} {brand:<20} {category:<25} {msrp:<12} {sale_price:<12}")
+        rows.append("="*100)
+        rows.append(f"\nTotal products found: {len(self.products)}")
 
-        print("="*100)
-        print(f"\nTotal products found: {len(self.products)}")
+        # Write the whole table at once instead of one print per row
+        sys.stdout.write('\n'.join(rows) + '\n')
 
     def save_to_json(self, filename: str = "products.json"):
         """Save products to JSON file"""
-        with open(filename, 'w') as f:
-            json.dump(self.products, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps([product.to_dict() for product in self.products], option=orjson.OPT_INDENT_2))
         print(f"\nResults saved to {filename}")
 
 
@@ -325,9 +497,11 @@ def main():
     parser = argparse.ArgumentParser(description='Monitor fitness equipment prices')
     parser.add_argument('--sample', action='store_true',
                         help='Use sample data instead of scraping')
+    parser.add_argument('--cache', action='store_true',
+                        help='Cache fetched pages on disk for an hour')
     args = parser.parse_args()
 
-    monitor = PriceMonitor()
+    monitor = PriceMonitor(use_cache=args.cache)
     print("Starting Product Price Monitor...")
     print("-" * 50)
 
@@ -0,0 +1,99 @@
+"""Tests for the product price monitor"""
+
+import asyncio
+import time
+
+import httpx
+
+from price_monitor import PriceMonitor, ProductParser, _make_price_parser, _parse_usd
+
+
+def test_parse_usd_keeps_adjacent_prices_apart():
+    assert _parse_usd('$1,299 $999') == 1299.0
+    assert _parse_usd('$1,299$999') == 1299.0
+    assert _parse_usd(' $1,299.00 ') == 1299.0
+    assert _parse_usd('$1299.00') == 1299.0
+
+
+def test_was_now_price_wrapper():
+    parser = ProductParser()
+    parser.feed(b'<div class="product"><h3 class="title">Bike</h3>'
+                b'<div class="price-box"><span class="price-was">$1,299</span> '
+                b'<span class="price-now">$999</span></div></div>')
+
+    products = PriceMonitor()._extract_products(parser.close(), 'Bowflex', 'Bikes', _parse_usd)
+
+    assert [(product.msrp, product.sale_price) for product in products] == [(1299.0, 999.0)]
+
+
+def test_parse_usd_reads_grouped_and_plain_amounts():
+    assert _parse_usd('Was $3,499.00 now') == 3499.0
+    assert _parse_usd('12,34,567') == 12.0
+    assert _parse_usd('Save 20%') == 20.0
+    assert _parse_usd('Call for price') is None
+    assert _parse_usd('') is None
+
+
+def test_price_parser_for_other_currency():
+    parse_cad = _make_price_parser('CA$')
+
+    assert parse_cad('CA$ 1,099.99') == 1099.99
+    assert parse_cad('Now CA$899') == 899.0
+
+
+def test_card_classes_match_ignoring_case():
+    parser = ProductParser()
+    parser.feed(b'<div class="PRODUCT"><h3 class="product-TITLE">X</h3>'
+                b'<span class="SalePRICE">$5</span></div>')
+
+    assert parser.close() == [('X', ['$5'])]
+
+
+def _robots_rules_for(handler):
+    monitor = PriceMonitor()
+    monitor.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return asyncio.run(monitor._fetch_robots('https://example.com/robots.txt'))
+
+
+def test_robots_server_error_disallows_host():
+    rules = _robots_rules_for(lambda request: httpx.Response(503))
+
+    assert not rules.can_fetch('Mozilla/5.0', 'https://example.com/treadmills')
+
+
+def test_robots_missing_file_allows_host():
+    rules = _robots_rules_for(lambda request: httpx.Response(404))
+
+    assert rules.can_fetch('Mozilla/5.0', 'https://example.com/treadmills')
+
+
+def test_robots_fetch_counts_against_host_burst():
+    started = []
+
+    def handler(request):
+        started.append(time.monotonic())
+        if request.url.path == '/robots.txt':
+            return httpx.Response(404)
+        return httpx.Response(200, content=b'<div class="product"><a>X</a></div>')
+
+    monitor = PriceMonitor()
+    monitor.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def fetch_all():
+        await asyncio.gather(*[monitor.fetch_page(f'https://example.com/{n}', delay=0.2)
+                               for n in range(3)])
+
+    asyncio.run(fetch_all())
+
+    first = min(started)
+    assert len(started) == 4
+    assert sum(1 for t in started if t - first < 0.1) == monitor.per_host_burst
+
+
+def test_read_products_sniffs_charset_lxml_does_not_know():
+    response = httpx.Response(200, headers={'Content-Type': 'text/html; charset=mac-roman'},
+                              content=b'<div class="product"><a>X</a><span class="price">$5</span></div>')
+
+    records = asyncio.run(PriceMonitor()._read_products(response))
+
+    assert records == [('X', ['$5'])]